@@ -18,12 +18,13 @@ Example:
 
 from __future__ import annotations
 
+import bisect
 import threading
 from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class DimensionSchema:
     """A named schema defining a set of recognized dimensions.
 
@@ -82,6 +83,8 @@ class DimensionRegistry:
 
     def __init__(self) -> None:
         self._schemas: dict[str, DimensionSchema] = {}
+        self._sorted_names: list[str] = []
+        self._resolve_cache: dict[str, DimensionSchema] = {}
         self._lock = threading.Lock()
 
     # ------------------------------------------------------------------
@@ -98,7 +101,10 @@ class DimensionRegistry:
         with self._lock:
             if schema.inherits and schema.inherits not in self._schemas:
                 raise ValueError(f"Parent schema '{schema.inherits}' not registered")
+            if schema.name not in self._schemas:
+                bisect.insort(self._sorted_names, schema.name)
             self._schemas[schema.name] = schema
+            self._resolve_cache.clear()
 
     def get(self, schema_name: str) -> DimensionSchema | None:
         """Look up a schema by name (``None`` if not found)."""
@@ -115,6 +121,9 @@ class DimensionRegistry:
         - ``metadata``: parent metadata merged with own (own wins).
         - ``inherits``: ``None`` (fully resolved).
 
+        Results are cached until the next :meth:`register` or
+        :meth:`unregister`; treat the returned schema as read-only.
+
         Raises:
             KeyError: If *schema_name* is not registered.
             ValueError: If a circular inheritance chain is detected.
@@ -174,19 +183,40 @@ class DimensionRegistry:
     def list_schemas(self) -> list[DimensionSchema]:
         """Return all registered schemas (snapshot, sorted by name)."""
         with self._lock:
-            return sorted(self._schemas.values(), key=lambda s: s.name)
+            return [self._schemas[name] for name in self._sorted_names]
 
     def unregister(self, schema_name: str) -> bool:
         """Remove a schema.  Returns ``True`` if it existed."""
         with self._lock:
-            return self._schemas.pop(schema_name, None) is not None
+            if self._schemas.pop(schema_name, None) is None:
+                return False
+            self._sorted_names.remove(schema_name)
+            self._resolve_cache.clear()
+            return True
 
     # ------------------------------------------------------------------
     # Internal
     # ------------------------------------------------------------------
 
+    def _restore(self, schemas: dict[str, DimensionSchema]) -> None:
+        """Replace all registered schemas with *schemas* (no parent checks)."""
+        with self._lock:
+            self._schemas.clear()
+            self._schemas.update(schemas)
+            self._sorted_names = sorted(schemas)
+            self._resolve_cache.clear()
+
     def _resolve_locked(self, schema_name: str) -> DimensionSchema:
         """Resolve inheritance while already holding ``_lock``."""
+        cached = self._resolve_cache.get(schema_name)
+        if cached is not None:
+            return cached
+        resolved = self._resolve_uncached_locked(schema_name)
+        self._resolve_cache[schema_name] = resolved
+        return resolved
+
+    def _resolve_uncached_locked(self, schema_name: str) -> DimensionSchema:
+        """Walk and merge the inheritance chain for *schema_name*."""
         schema = self._schemas.get(schema_name)
         if schema is None:
             raise KeyError(f"Schema '{schema_name}' not registered")
@@ -287,6 +317,11 @@ _BUILTIN_SCHEMAS: list[DimensionSchema] = [
     ),
 ]
 
+# Snapshot of the built-in registry contents.  reset_registry() restores
+# from it with a single clear()+update() instead of building a fresh
+# registry and calling register() once per built-in schema.
+_PRISTINE_SCHEMAS: dict[str, DimensionSchema] = {schema.name: schema for schema in _BUILTIN_SCHEMAS}
+
 # ======================================================================
 # Singleton
 # ======================================================================
@@ -312,7 +347,11 @@ def get_registry() -> DimensionRegistry:
 
 
 def reset_registry() -> None:
-    """Reset the global registry (mainly for testing)."""
-    global _registry_instance
+    """Reset the global registry to the built-in schemas (mainly for testing).
+
+    The singleton instance is kept; its contents are restored from a
+    snapshot taken at import rather than re-registered one by one.
+    """
     with _registry_lock:
-        _registry_instance = None
+        if _registry_instance is not None:
+            _registry_instance._restore(_PRISTINE_SCHEMAS)
@@ -11,7 +11,13 @@ def pytest_configure(config: pytest.Config) -> None:
     config.addinivalue_line("markers", "slow: Slow tests (>5s)")
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture
 def _reset_registry() -> None:
-    """Reset the dimension registry before each test to ensure isolation."""
+    """Reset the global dimension registry before a test to ensure isolation.
+
+    Opt in with ``@pytest.mark.usefixtures("_reset_registry")`` on tests
+    that mutate or inspect the global registry; tests that only build
+    local ``DimensionRegistry`` instances or read the built-in schemas
+    do not need it.
+    """
     reset_registry()
@@ -0,0 +1,63 @@
+"""Micro-benchmarks for aggregation and schema resolution.
+
+Marked ``slow`` so the default ``make test`` run skips them; run with
+``make bench``.  Inputs are built outside the timed call so only the
+target function is measured.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import TYPE_CHECKING
+
+import pytest
+
+from our_confidence import (
+    CORE_DIMENSIONS,
+    DimensionalConfidence,
+    DimensionRegistry,
+    DimensionSchema,
+    aggregate_confidence,
+)
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.slow
+
+
+def _make_confidences(n: int) -> list[DimensionalConfidence]:
+    """Deterministic inputs with every core dimension set."""
+    rng = random.Random(0)
+    return [
+        DimensionalConfidence(
+            overall=rng.random(),
+            dimensions={str(dim): rng.random() for dim in CORE_DIMENSIONS},
+        )
+        for _ in range(n)
+    ]
+
+
+@pytest.mark.parametrize("method", ["geometric", "weighted_average", "minimum", "maximum"])
+@pytest.mark.parametrize("n", [2, 10, 100, 1000])
+def test_aggregate_confidence(benchmark: BenchmarkFixture, n: int, method: str) -> None:
+    confidences = _make_confidences(n)
+    result = benchmark(aggregate_confidence, confidences, method=method)
+    assert 0.0 <= result.overall <= 1.0
+
+
+def test_resolve_inherited(benchmark: BenchmarkFixture) -> None:
+    reg = DimensionRegistry()
+    reg.register(DimensionSchema(name="root", dimensions=["a", "b"], required=["a"]))
+    reg.register(DimensionSchema(name="mid", dimensions=["c"], inherits="root"))
+    reg.register(DimensionSchema(name="leaf", dimensions=["d"], inherits="mid"))
+    resolved = benchmark(reg.resolve, "leaf")
+    assert resolved.dimensions == ["a", "b", "c", "d"]
+
+
+def test_recalculate_overall(benchmark: BenchmarkFixture) -> None:
+    conf = _make_confidences(1)[0]
+    result = benchmark(conf.recalculate_overall)
+    assert 0.0 <= result.overall <= 1.0
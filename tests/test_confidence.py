@@ -1,5 +1,10 @@
 """Tests for DimensionalConfidence."""
 
+import math
+import re
+import weakref
+from functools import reduce
+
 import pytest
 
 from our_confidence import (
@@ -8,6 +13,31 @@ from our_confidence import (
     confidence_label,
 )
 
+_OVERALL_OUT_OF_RANGE = re.compile("overall must be between 0 and 1")
+_OUT_OF_RANGE = re.compile("must be between 0 and 1")
+
+
+@pytest.fixture(scope="module")
+def full_confidence() -> DimensionalConfidence:
+    """Shared six-dimension confidence; tests must not mutate it."""
+    return DimensionalConfidence.full(
+        source_reliability=0.8,
+        method_quality=0.7,
+        internal_consistency=0.9,
+        temporal_freshness=0.85,
+        corroboration=0.6,
+        domain_applicability=0.75,
+    )
+
+
+@pytest.fixture(scope="module")
+def conf_pair() -> tuple[DimensionalConfidence, DimensionalConfidence]:
+    """Shared pair for aggregation tests; tests must not mutate it."""
+    return (
+        DimensionalConfidence(overall=0.8, source_reliability=0.5),
+        DimensionalConfidence(overall=0.6, source_reliability=0.9),
+    )
+
 
 class TestDimensionalConfidenceInit:
     def test_simple_creation(self) -> None:
@@ -30,12 +60,19 @@ class TestDimensionalConfidenceInit:
         assert conf.source_reliability == 0.8
         assert conf.corroboration == 0.6
 
+    def test_slotted(self) -> None:
+        conf = DimensionalConfidence(overall=0.8)
+        assert not hasattr(conf, "__dict__")
+        with pytest.raises(AttributeError):
+            conf.unknown = 0.5  # type: ignore[attr-defined]
+        assert weakref.ref(conf)() is conf
+
     def test_overall_out_of_range(self) -> None:
-        with pytest.raises(ValueError, match="overall must be between 0 and 1"):
+        with pytest.raises(ValueError, match=_OVERALL_OUT_OF_RANGE):
             DimensionalConfidence(overall=1.5)
 
     def test_dimension_out_of_range(self) -> None:
-        with pytest.raises(ValueError, match="must be between 0 and 1"):
+        with pytest.raises(ValueError, match=_OUT_OF_RANGE):
             DimensionalConfidence(overall=0.5, source_reliability=2.0)
 
 
@@ -45,17 +82,9 @@ class TestFactoryMethods:
         assert conf.overall == 0.9
         assert conf.dimensions == {}
 
-    def test_full(self) -> None:
-        conf = DimensionalConfidence.full(
-            source_reliability=0.8,
-            method_quality=0.7,
-            internal_consistency=0.9,
-            temporal_freshness=0.85,
-            corroboration=0.6,
-            domain_applicability=0.75,
-        )
-        assert 0.0 <= conf.overall <= 1.0
-        assert conf.source_reliability == 0.8
+    def test_full(self, full_confidence: DimensionalConfidence) -> None:
+        assert 0.0 <= full_confidence.overall <= 1.0
+        assert full_confidence.source_reliability == 0.8
 
     def test_from_dimensions(self) -> None:
         dims = {"source_reliability": 0.9, "method_quality": 0.8}
@@ -77,19 +106,18 @@ class TestSerialization:
         d = conf.to_dict()
         assert d["schema"] == "custom.v1"
 
-    def test_from_dict_roundtrip(self) -> None:
-        original = DimensionalConfidence.full(
-            source_reliability=0.8,
-            method_quality=0.7,
-            internal_consistency=0.9,
-            temporal_freshness=0.85,
-            corroboration=0.6,
-            domain_applicability=0.75,
-        )
-        d = original.to_dict()
+    def test_from_dict_roundtrip(self, full_confidence: DimensionalConfidence) -> None:
+        d = full_confidence.to_dict()
         restored = DimensionalConfidence.from_dict(d)
-        assert abs(original.overall - restored.overall) < 0.0001
-        assert original.dimensions == restored.dimensions
+        assert restored == full_confidence
+
+    def test_from_dict_skips_non_numeric(self) -> None:
+        conf = DimensionalConfidence.from_dict(
+            {"overall": 0.6, "schema": "custom.v1", "custom_dim": 1, "note": "text", "tags": None}
+        )
+        assert conf.schema == "custom.v1"
+        assert conf.dimensions == {"custom_dim": 1.0}
+        assert list(conf.to_dict()) == ["overall", "schema", "custom_dim"]
 
 
 class TestManipulation:
@@ -103,12 +131,13 @@ class TestManipulation:
     def test_decay(self) -> None:
         conf = DimensionalConfidence(overall=0.8, temporal_freshness=1.0)
         decayed = conf.decay(factor=0.9)
-        assert decayed.temporal_freshness == pytest.approx(0.9)
+        assert decayed.temporal_freshness is not None
+        assert abs(decayed.temporal_freshness - 0.9) < 1e-9
 
     def test_decay_no_temporal(self) -> None:
         conf = DimensionalConfidence(overall=0.8)
         decayed = conf.decay(factor=0.9)
-        assert decayed.overall == pytest.approx(0.72)
+        assert abs(decayed.overall - 0.72) < 1e-9
 
     def test_boost_corroboration(self) -> None:
         conf = DimensionalConfidence(overall=0.7, corroboration=0.5)
@@ -125,12 +154,31 @@ class TestManipulation:
 
 
 class TestConfidenceLabel:
-    def test_labels(self) -> None:
-        assert confidence_label(0.95) == "very high"
-        assert confidence_label(0.8) == "high"
-        assert confidence_label(0.6) == "moderate"
-        assert confidence_label(0.3) == "low"
-        assert confidence_label(0.1) == "very low"
+    @pytest.mark.parametrize(
+        ("score", "label"),
+        [
+            (0.95, "very high"),
+            (0.8, "high"),
+            (0.6, "moderate"),
+            (0.3, "low"),
+            (0.1, "very low"),
+        ],
+    )
+    def test_labels(self, score: float, label: str) -> None:
+        assert confidence_label(score) == label
+
+    @pytest.mark.parametrize(
+        ("score", "label"),
+        [
+            (0.9, "very high"),
+            (0.75, "high"),
+            (0.5, "moderate"),
+            (0.25, "low"),
+            (0.0, "very low"),
+        ],
+    )
+    def test_boundaries_inclusive(self, score: float, label: str) -> None:
+        assert confidence_label(score) == label
 
 
 class TestAggregation:
@@ -143,26 +191,79 @@ class TestAggregation:
         result = aggregate_confidence([conf])
         assert result is conf
 
-    def test_geometric(self) -> None:
-        c1 = DimensionalConfidence(overall=0.8, source_reliability=0.9)
-        c2 = DimensionalConfidence(overall=0.6, source_reliability=0.7)
-        result = aggregate_confidence([c1, c2], method="geometric")
-        assert 0.0 <= result.overall <= 1.0
-        assert result.source_reliability is not None
-
-    def test_minimum(self) -> None:
-        c1 = DimensionalConfidence(overall=0.8, source_reliability=0.9)
+    def test_aggregation_methods(
+        self,
+        subtests: pytest.Subtests,
+        conf_pair: tuple[DimensionalConfidence, DimensionalConfidence],
+    ) -> None:
+        # conf_pair is (overall=0.8, sr=0.5) and (overall=0.6, sr=0.9); the
+        # geometric mean weights each value by its confidence's overall
+        cases = [
+            (
+                "geometric",
+                math.exp((0.8 * math.log(0.8) + 0.6 * math.log(0.6)) / 1.4),
+                math.exp((0.8 * math.log(0.5) + 0.6 * math.log(0.9)) / 1.4),
+            ),
+            ("minimum", 0.6, 0.5),
+            ("maximum", 0.8, 0.9),
+        ]
+        for method, expected_overall, expected_sr in cases:
+            with subtests.test(method=method):
+                result = aggregate_confidence(list(conf_pair), method=method)
+                assert abs(result.overall - expected_overall) < 1e-9
+                assert result.source_reliability is not None
+                assert abs(result.source_reliability - expected_sr) < 1e-9
+
+    def test_dimension_missing_from_some_inputs(self, subtests: pytest.Subtests) -> None:
+        c1 = DimensionalConfidence(overall=0.8, source_reliability=0.9, corroboration=0.4)
         c2 = DimensionalConfidence(overall=0.6, source_reliability=0.7)
-        result = aggregate_confidence([c1, c2], method="minimum")
+        for method in ("geometric", "weighted_average", "minimum", "maximum"):
+            with subtests.test(method=method):
+                result = aggregate_confidence([c1, c2], method=method)
+                assert result.corroboration is not None
+                assert abs(result.corroboration - 0.4) < 1e-9
+
+    def test_extremes_accept_generator(self, conf_pair: tuple[DimensionalConfidence, DimensionalConfidence]) -> None:
+        result = aggregate_confidence((c for c in conf_pair), method="minimum")
         assert result.overall == 0.6
-        assert result.source_reliability == 0.7
+        assert result.source_reliability == 0.5
 
-    def test_maximum(self) -> None:
-        c1 = DimensionalConfidence(overall=0.8, source_reliability=0.5)
+    def test_geometric_accepts_generator(self, conf_pair: tuple[DimensionalConfidence, DimensionalConfidence]) -> None:
+        result = aggregate_confidence(c for c in conf_pair)
+        assert result == aggregate_confidence(list(conf_pair))
+
+    def test_single_from_generator(self) -> None:
+        conf = DimensionalConfidence.simple(0.8)
+        assert aggregate_confidence(iter([conf]), method="maximum") is conf
+
+
+class TestMerge:
+    def test_merge_min(self) -> None:
+        c1 = DimensionalConfidence(overall=0.8, source_reliability=0.5, corroboration=0.4)
         c2 = DimensionalConfidence(overall=0.6, source_reliability=0.9)
-        result = aggregate_confidence([c1, c2], method="maximum")
-        assert result.overall == 0.8
-        assert result.source_reliability == 0.9
+        merged = c1.merge_min(c2)
+        assert merged.overall == 0.6
+        assert merged.source_reliability == 0.5
+        assert merged.corroboration == 0.4
+        # Inputs unchanged
+        assert c1.dimensions == {"source_reliability": 0.5, "corroboration": 0.4}
+
+    def test_merge_max(self) -> None:
+        c1 = DimensionalConfidence(overall=0.8, source_reliability=0.5)
+        c2 = DimensionalConfidence(overall=0.6, source_reliability=0.9, corroboration=0.4)
+        merged = c1.merge_max(c2)
+        assert merged.overall == 0.8
+        assert merged.source_reliability == 0.9
+        assert merged.corroboration == 0.4
+
+    def test_fold_matches_aggregate(self) -> None:
+        confs = [
+            DimensionalConfidence(overall=0.8, source_reliability=0.5),
+            DimensionalConfidence(overall=0.6, method_quality=0.7),
+            DimensionalConfidence(overall=0.9, source_reliability=0.3, method_quality=0.9),
+        ]
+        assert reduce(DimensionalConfidence.merge_min, confs) == aggregate_confidence(confs, method="minimum")
+        assert reduce(DimensionalConfidence.merge_max, confs) == aggregate_confidence(confs, method="maximum")
 
 
 class TestEquality:
@@ -180,6 +281,13 @@ class TestEquality:
         conf = DimensionalConfidence(overall=0.7)
         assert conf != "not a confidence"
 
+    def test_other_type_defers_to_reflected_eq(self) -> None:
+        conf = DimensionalConfidence(overall=0.7)
+        assert conf.__eq__("not a confidence") is NotImplemented
+
+    def test_equal_to_self(self, full_confidence: DimensionalConfidence) -> None:
+        assert full_confidence == full_confidence
+
 
 class TestSetDimension:
     def test_set_new(self) -> None:
@@ -195,5 +303,5 @@ class TestSetDimension:
 
     def test_set_out_of_range(self) -> None:
         conf = DimensionalConfidence(overall=0.7)
-        with pytest.raises(ValueError, match="must be between 0 and 1"):
+        with pytest.raises(ValueError, match=_OUT_OF_RANGE):
             conf.set_dimension("bad", 1.5)
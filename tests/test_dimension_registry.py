@@ -1,13 +1,24 @@
 """Tests for DimensionRegistry."""
 
+import re
+import weakref
+from dataclasses import FrozenInstanceError
+
 import pytest
 
 from our_confidence import (
     DimensionRegistry,
     DimensionSchema,
     get_registry,
+    reset_registry,
 )
 
+_NOT_EMPTY = re.compile("must not be empty")
+_MUST_BE_LESS = re.compile("must be less than")
+_NOT_IN_DIMS = re.compile("not in dimensions")
+_CIRCULAR = re.compile("Circular")
+_NOT_REGISTERED = re.compile("not registered")
+
 
 class TestDimensionSchema:
     def test_create(self) -> None:
@@ -19,16 +30,23 @@ class TestDimensionSchema:
         assert schema.name == "test.v1"
         assert schema.dimensions == ["a", "b"]
 
+    def test_is_frozen_and_slotted(self) -> None:
+        schema = DimensionSchema(name="test.v1", dimensions=["a"])
+        assert not hasattr(schema, "__dict__")
+        assert weakref.ref(schema)() is schema
+        with pytest.raises(FrozenInstanceError):
+            schema.name = "other"  # type: ignore[misc]
+
     def test_empty_name_raises(self) -> None:
-        with pytest.raises(ValueError, match="must not be empty"):
+        with pytest.raises(ValueError, match=_NOT_EMPTY):
             DimensionSchema(name="")
 
     def test_bad_range_raises(self) -> None:
-        with pytest.raises(ValueError, match="must be less than"):
+        with pytest.raises(ValueError, match=_MUST_BE_LESS):
             DimensionSchema(name="test", value_range=(1.0, 0.0))
 
     def test_required_not_in_dimensions_raises(self) -> None:
-        with pytest.raises(ValueError, match="not in dimensions"):
+        with pytest.raises(ValueError, match=_NOT_IN_DIMS):
             DimensionSchema(name="test", dimensions=["a"], required=["b"])
 
 
@@ -58,35 +76,51 @@ class TestDimensionRegistry:
         schemas = reg.list_schemas()
         assert [s.name for s in schemas] == ["a", "b"]
 
-
-class TestValidation:
-    def test_valid(self) -> None:
+    def test_list_schemas_after_reregister_and_unregister(self) -> None:
         reg = DimensionRegistry()
-        reg.register(DimensionSchema(name="test", dimensions=["a", "b"], required=["a"]))
-        result = reg.validate("test", {"a": 0.5, "b": 0.8})
-        assert result.valid
-        assert result.errors == []
+        reg.register(DimensionSchema(name="c", dimensions=["x"]))
+        reg.register(DimensionSchema(name="a", dimensions=["x"]))
+        replacement = DimensionSchema(name="c", dimensions=["y"])
+        reg.register(replacement)
+        reg.register(DimensionSchema(name="b", dimensions=["x"]))
+        reg.unregister("a")
+        schemas = reg.list_schemas()
+        assert [s.name for s in schemas] == ["b", "c"]
+        assert schemas[1] is replacement
 
-    def test_missing_required(self) -> None:
-        reg = DimensionRegistry()
-        reg.register(DimensionSchema(name="test", dimensions=["a", "b"], required=["a"]))
-        result = reg.validate("test", {"b": 0.5})
-        assert not result.valid
-        assert any("Missing required" in e for e in result.errors)
 
-    def test_out_of_range(self) -> None:
-        reg = DimensionRegistry()
-        reg.register(DimensionSchema(name="test", dimensions=["a"]))
-        result = reg.validate("test", {"a": 1.5})
-        assert not result.valid
-        assert any("out of range" in e for e in result.errors)
+@pytest.fixture(scope="module")
+def validation_reg() -> DimensionRegistry:
+    """Registry with a single two-dimension schema; tests must not mutate it."""
+    reg = DimensionRegistry()
+    reg.register(DimensionSchema(name="test", dimensions=["a", "b"], required=["a"]))
+    return reg
 
-    def test_unknown_dimension(self) -> None:
-        reg = DimensionRegistry()
-        reg.register(DimensionSchema(name="test", dimensions=["a"]))
-        result = reg.validate("test", {"a": 0.5, "unknown": 0.5})
-        assert not result.valid
-        assert any("Unknown dimension" in e for e in result.errors)
+
+class TestValidation:
+    @pytest.mark.parametrize(
+        ("payload", "expected_valid", "error_substr"),
+        [
+            ({"a": 0.5, "b": 0.8}, True, None),
+            ({"b": 0.5}, False, "Missing required"),
+            ({"a": 1.5}, False, "out of range"),
+            ({"a": 0.5, "unknown": 0.5}, False, "Unknown dimension"),
+        ],
+        ids=["valid", "missing_required", "out_of_range", "unknown_dimension"],
+    )
+    def test_validate(
+        self,
+        validation_reg: DimensionRegistry,
+        payload: dict[str, float],
+        expected_valid: bool,
+        error_substr: str | None,
+    ) -> None:
+        result = validation_reg.validate("test", payload)
+        assert result.valid is expected_valid
+        if error_substr is None:
+            assert result.errors == []
+        else:
+            assert error_substr in " ".join(result.errors)
 
     def test_unknown_schema(self) -> None:
         reg = DimensionRegistry()
@@ -109,21 +143,44 @@ class TestInheritance:
         resolved = reg.resolve("standalone")
         assert resolved.dimensions == ["x"]
 
+    def test_resolve_is_cached(self) -> None:
+        reg = DimensionRegistry()
+        reg.register(DimensionSchema(name="parent", dimensions=["a"]))
+        reg.register(DimensionSchema(name="child", dimensions=["b"], inherits="parent"))
+        assert reg.resolve("child") is reg.resolve("child")
+
+    def test_register_invalidates_resolve_cache(self) -> None:
+        reg = DimensionRegistry()
+        reg.register(DimensionSchema(name="parent", dimensions=["a"]))
+        reg.register(DimensionSchema(name="child", dimensions=["b"], inherits="parent"))
+        assert reg.resolve("child").dimensions == ["a", "b"]
+        reg.register(DimensionSchema(name="parent", dimensions=["a", "z"]))
+        assert reg.resolve("child").dimensions == ["a", "z", "b"]
+
+    def test_unregister_invalidates_resolve_cache(self) -> None:
+        reg = DimensionRegistry()
+        reg.register(DimensionSchema(name="standalone", dimensions=["x"]))
+        reg.resolve("standalone")
+        reg.unregister("standalone")
+        with pytest.raises(KeyError):
+            reg.resolve("standalone")
+
     def test_circular_inheritance(self) -> None:
         reg = DimensionRegistry()
         reg.register(DimensionSchema(name="a", dimensions=["x"]))
         reg.register(DimensionSchema(name="b", dimensions=["y"], inherits="a"))
         # Manually create circular reference
         reg._schemas["a"] = DimensionSchema(name="a", dimensions=["x"], inherits="b")
-        with pytest.raises(ValueError, match="Circular"):
+        with pytest.raises(ValueError, match=_CIRCULAR):
             reg.resolve("a")
 
     def test_missing_parent_on_register(self) -> None:
         reg = DimensionRegistry()
-        with pytest.raises(ValueError, match="not registered"):
+        with pytest.raises(ValueError, match=_NOT_REGISTERED):
             reg.register(DimensionSchema(name="child", dimensions=["x"], inherits="missing"))
 
 
+@pytest.mark.usefixtures("_reset_registry")
 class TestGlobalRegistry:
     def test_has_builtin_schemas(self) -> None:
         registry = get_registry()
@@ -145,3 +202,12 @@ class TestGlobalRegistry:
         # Should have both parent and child dimensions
         assert "conclusions" in resolved.dimensions
         assert "honesty" in resolved.dimensions
+
+    def test_reset_restores_builtins(self) -> None:
+        registry = get_registry()
+        registry.register(DimensionSchema(name="custom.v1", dimensions=["a"]))
+        registry.unregister("v1.trust.core")
+        reset_registry()
+        assert get_registry() is registry
+        assert registry.get("custom.v1") is None
+        assert registry.get("v1.trust.core") is not None